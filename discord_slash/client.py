@@ -1,6 +1,7 @@
 import logging
 import typing
 import disnake
+from collections import OrderedDict
 from inspect import iscoroutinefunction, getdoc
 from disnake.ext import commands
 from . import http
@@ -42,6 +43,7 @@ class SlashCommand:
         self.req = http.SlashCommandRequest(self.logger, self._discord)
         self.auto_register = auto_register
         self.auto_delete = auto_delete
+        self._recent_interactions = OrderedDict()
 
         if self.auto_register and self.auto_delete:
             self._discord.loop.create_task(self.sync_all_commands())
@@ -687,37 +689,41 @@ class SlashCommand:
 
         :param msg: Gateway message.
         """
+        if msg["t"] == "MESSAGE_CREATE":
+            return context._resolve_user_input(msg["d"], self._discord)
         if msg["t"] != "INTERACTION_CREATE":
             return
 
         to_use = msg["d"]
 
-        if to_use["data"]["name"] in self.commands:
-
-            ctx = context.SlashContext(self.req, to_use, self._discord, self.logger)
-            cmd_name = to_use["data"]["name"]
+        # Same interaction may be delivered again, only handle it once.
+        if to_use["id"] in self._recent_interactions:
+            return
+        self._recent_interactions[to_use["id"]] = None
+        if len(self._recent_interactions) > 4096:
+            self._recent_interactions.popitem(last=False)
 
-            if cmd_name not in self.commands and cmd_name in self.subcommands:
-                return await self.handle_subcommand(ctx, to_use)
+        data = to_use["data"]
+        selected_cmd = self.commands.get(data["name"])
 
-            selected_cmd = self.commands[to_use["data"]["name"]]
+        if selected_cmd:
 
-            if selected_cmd.allowed_guild_ids:
-                guild_id = ctx.guild.id if isinstance(ctx.guild, disnake.Guild) else ctx.guild
+            # Checked from the payload, so contexts aren't built for commands that won't run.
+            if selected_cmd.allowed_guild_ids and int(to_use["guild_id"]) not in selected_cmd.allowed_guild_ids:
+                return
 
-                if guild_id not in selected_cmd.allowed_guild_ids:
-                    return
+            ctx = context.SlashContext(self.req, to_use, self._discord, self.logger)
 
             if selected_cmd.has_subcommands and not selected_cmd.func:
                 return await self.handle_subcommand(ctx, to_use)
 
-            if "options" in to_use["data"]:
-                for x in to_use["data"]["options"]:
+            if "options" in data:
+                for x in data["options"]:
                     if "value" not in x:
                         return await self.handle_subcommand(ctx, to_use)
 
-            args = await self.process_options(ctx.guild, to_use["data"]["options"], selected_cmd.auto_convert) \
-                if "options" in to_use["data"] else []
+            args = await self.process_options(ctx.guild, data["options"], selected_cmd.auto_convert) \
+                if "options" in data else []
 
             self._discord.dispatch("slash_command", ctx)
 
@@ -1,13 +1,51 @@
+import sys
 import typing
 import asyncio
 import disnake
 from contextlib import suppress
+from functools import lru_cache
 from disnake.ext import commands
 from . import http
 from . import error
 from . import model
 
 
+def _allowed_mentions_dict(allowed_mentions: typing.Optional[disnake.AllowedMentions],
+                           default: typing.Optional[disnake.AllowedMentions]) -> dict:
+    # Serialized on every call since AllowedMentions can be modified in place.
+    if allowed_mentions:
+        return allowed_mentions.to_dict()
+    return default.to_dict() if default else {}
+
+
+@lru_cache(maxsize=256)
+def _command_prefix(name: str, command_id: str) -> str:
+    # Content prefix of the user input message of the command.
+    return sys.intern(f"</{name}:{command_id}>")
+
+
+# Futures of contexts waiting for their user input message, keyed by (channel ID, author ID, content prefix).
+_pending_user_inputs: typing.Dict[typing.Tuple[int, int, str], asyncio.Future] = {}
+
+
+def _resolve_user_input(data: dict, _discord: typing.Union[disnake.Client, commands.Bot]):
+    """
+    Passes a raw ``MESSAGE_CREATE`` payload to the context waiting for it, if any.
+
+    :param data: Gateway message data.
+    :param _discord: disnake client.
+    """
+    if not _pending_user_inputs or data.get("type") != 20:
+        return
+    content = data["content"]
+    key = (int(data["channel_id"]), int(data["author"]["id"]), content[:content.find(">") + 1])
+    future = _pending_user_inputs.pop(key, None)
+    if future is None or future.done():
+        return
+    channel = _discord.get_channel(key[0]) or disnake.Object(id=key[0])
+    future.set_result(disnake.Message(state=_discord._connection, channel=channel, data=data))
+
+
 class SlashContext:
     """
     Context of the slash command.\n
@@ -16,7 +54,11 @@ class SlashContext:
     .. warning::
         Do not manually init this model.
 
-    :ivar message: Message that invoked the slash command.
+    .. note::
+        Custom attributes can still be set on the context, but ``message`` is read-only.
+
+    :ivar message: Message that invoked the slash command. This is ``None`` until the message is received after
+        :meth:`.respond`, use :meth:`.get_message` to wait for it.
     :ivar name: Name of the command.
     :ivar subcommand_name: Subcommand of the command.
     :ivar subcommand_group: Subcommand group of the command.
@@ -25,40 +67,51 @@ class SlashContext:
     :ivar _http: :class:`.http.SlashCommandRequest` of the client.
     :ivar bot: disnake client.
     :ivar logger: Logger instance.
-    :ivar sent: Whether you sent the initial response.
+    :ivar sent: State of the response. ``0`` if nothing is sent, ``1`` if the initial response is sent and ``2`` if a message is sent.
     :ivar guild: :class:`discord.Guild` instance or guild ID of the command message.
     :ivar author: :class:`discord.Member` instance or user ID representing author of the command message.
     :ivar channel: :class:`discord.TextChannel` instance or channel ID representing channel of the command message.
     """
 
+    __slots__ = ("__token", "_message_future", "name", "command", "invoked_with",
+                 "subcommand", "subcommand_name", "invoked_subcommand", "subcommand_passed",
+                 "subcommand_group", "invoked_subcommand_group", "subcommand_group_passed",
+                 "interaction_id", "command_id", "_http", "bot", "logger", "sent",
+                 "guild", "author", "channel", "_author_id", "_channel_id", "_channel_for_message",
+                 "__dict__")  # Keeps custom attributes set by commands and checks working.
+
     def __init__(self,
                  _http: http.SlashCommandRequest,
                  _json: dict,
                  _discord: typing.Union[disnake.Client, commands.Bot],
                  logger):
+        data = _json["data"]
+        user_id = int(_json["member"]["user"]["id"])
+        channel_id = int(_json["channel_id"])
+        guild_id = int(_json["guild_id"])
+        guild = _discord.get_guild(guild_id)
+        author = guild.get_member(user_id) if guild else None
+        channel = guild.get_channel(channel_id) if guild else None
+
         self.__token = _json["token"]
-        self.message = None # Should be set later.
-        self.name = self.command = self.invoked_with = _json["data"]["name"]
+        self._message_future = None # Should be set at respond.
+        self.name = self.command = self.invoked_with = data["name"]
         self.subcommand_name = self.invoked_subcommand = self.subcommand_passed = None
         self.subcommand_group = self.invoked_subcommand_group = self.subcommand_group_passed = None
         self.interaction_id = _json["id"]
-        self.command_id = _json["data"]["id"]
+        self.command_id = data["id"]
         self._http = _http
         self.bot = _discord
         self.logger = logger
-        self.sent = False
-        self.guild: typing.Union[disnake.Guild, int] = _discord.get_guild(int(_json["guild_id"]))
-        self.author: typing.Union[disnake.Member, int] = self.guild.get_member(int(_json["member"]["user"]["id"])) \
-            if self.guild else None
-        self.channel: typing.Union[disnake.TextChannel, int] = self.guild.get_channel(int(_json["channel_id"])) \
-            if self.guild else None
-        if not self.author:
-            self.author = int(_json["member"]["user"]["id"])
-        if not self.channel:
-            self.channel = int(_json["channel_id"])
-        if not self.guild:
-            # Should be set after every others are set.
-            self.guild = int(_json["guild_id"])
+        self.sent = 0
+        self.guild: typing.Union[disnake.Guild, int] = guild or guild_id
+        self.author: typing.Union[disnake.Member, int] = author or user_id
+        self.channel: typing.Union[disnake.TextChannel, int] = channel or channel_id
+        # Resolved once here so send and the user input check don't need type checks.
+        self._author_id = user_id
+        self._channel_id = channel_id
+        self._channel_for_message = channel if isinstance(channel, disnake.TextChannel) \
+            else disnake.Object(id=channel_id)
 
     async def respond(self, eat: bool = False):
         """
@@ -67,30 +120,54 @@ class SlashContext:
 
         .. note::
             If `eat` is ``False``, there is a chance that ``message`` variable is present.
+            This doesn't wait for the message, use :meth:`.get_message` if you need it.
+
+        :param eat: Whether to eat user's input. Default ``False``.
+        """
+        if not eat and self._message_future is None:
+            key = (self._channel_id, self._author_id, _command_prefix(self.name, self.command_id))
+            future = self.bot.loop.create_future()
+            _pending_user_inputs[key] = future
+            self._message_future = asyncio.ensure_future(self._wait_message(key, future))
+        await self.ack(eat)
+
+    async def ack(self, eat: bool = False):
+        """
+        Sends only the initial response to the interaction, without looking for the user's input message.
 
         :param eat: Whether to eat user's input. Default ``False``.
         """
         base = {"type": 2 if eat else 5}
-        _task = self.bot.loop.create_task(self._http.post(base, False, self.interaction_id, self.__token, True))
-        self.sent = True
-        if not eat:
+        await self._http.post_json(base, False, self.interaction_id, self.__token, True)
+        self.sent = self.sent or 1
+
+    async def _wait_message(self, key, future):
+        try:
             with suppress(asyncio.TimeoutError):
-                def check(message: disnake.Message):
-                    user_id = self.author if isinstance(self.author, int) else self.author.id
-                    is_author = message.author.id == user_id
-                    channel_id = self.channel if isinstance(self.channel, int) else self.channel.id
-                    is_channel = channel_id == message.channel.id
-                    is_user_input = message.type == 20
-                    is_correct_command = message.content.startswith(f"</{self.name}:{self.command_id}>")
-                    return is_author and is_channel and is_user_input and is_correct_command
-
-                self.message = await self.bot.wait_for("message", timeout=3, check=check)
-        await _task
+                return await asyncio.wait_for(future, 3)
+        finally:
+            if _pending_user_inputs.get(key) is future:
+                del _pending_user_inputs[key]
 
     @property
-    def ack(self):
-        """Alias of :meth:`.respond`."""
-        return self.respond
+    def message(self) -> typing.Optional[disnake.Message]:
+        """Message that invoked the slash command, or ``None`` if it is not (yet) received."""
+        if self._message_future is None or not self._message_future.done() or self._message_future.cancelled():
+            return None
+        return self._message_future.result()
+
+    async def get_message(self) -> typing.Optional[disnake.Message]:
+        """
+        Waits for the message that invoked the slash command.
+
+        .. note::
+            This only works after :meth:`.respond` is called with ``eat=False``, otherwise returns ``None``.
+
+        :return: Optional[disnake.Message]
+        """
+        if self._message_future is None:
+            return None
+        return await self._message_future
 
     async def send(self,
                    content: str = "", *,
@@ -137,8 +214,8 @@ class SlashContext:
         if isinstance(content, int) and 2 <= content <= 5:
             raise error.IncorrectFormat("`.send` Method is rewritten at Release 1.0.9. Please read the docs and fix all the usages.")
         if not self.sent:
-            self.logger.warning(f"At command `{self.name}`: It is highly recommended to call `.respond()` first!")
-            await self.respond()
+            self.logger.warning("At command `%s`: It is highly recommended to call `.respond()` first!", self.name)
+            await self.ack()
         if hidden:
             if embeds or embed:
                 self.logger.warning("Embed is not supported for `hidden`!")
@@ -157,37 +234,40 @@ class SlashContext:
         if file:
             files = [file]
 
-        base = {
-            "content": content,
-            "tts": tts,
-            "embeds": [x.to_dict() for x in embeds] if embeds else [],
-            "allowed_mentions": allowed_mentions.to_dict() if allowed_mentions
-            else self.bot.allowed_mentions.to_dict() if self.bot.allowed_mentions else {}
-        }
+        base = self._make_base(content, tts, embeds, allowed_mentions)
 
-        resp = await self._http.post(base, wait, self.interaction_id, self.__token, files=files)
+        resp = await self._post(base, wait, files)
         smsg = model.SlashMessage(state=self.bot._connection,
                                   data=resp,
-                                  channel=self.channel if isinstance(self.channel, disnake.TextChannel) else disnake.Object(id=self.channel),
+                                  channel=self._channel_for_message,
                                   _http=self._http,
                                   interaction_token=self.__token)
         if delete_after:
             self.bot.loop.create_task(smsg.delete(delay=delete_after))
         return smsg
 
-    def _legacy_send(self, content, tts, embeds, allowed_mentions):
+    def _make_base(self, content, tts, embeds, allowed_mentions) -> dict:
+        # Empty allowed_mentions is kept since Discord treats it differently from omitting it.
         base = {
             "content": content,
-            "tts": tts,
-            "embeds": [x.to_dict() for x in embeds] if embeds else [],
-            "allowed_mentions": allowed_mentions.to_dict() if allowed_mentions
-            else self.bot.allowed_mentions.to_dict() if self.bot.allowed_mentions else {}
+            "allowed_mentions": _allowed_mentions_dict(allowed_mentions, self.bot.allowed_mentions)
         }
-        return self._http.post(base, False, self.interaction_id, self.__token)
+        if tts:
+            base["tts"] = True
+        if embeds:
+            base["embeds"] = [x.to_dict() for x in embeds]
+        return base
+
+    async def _post(self, base: dict, wait: bool = False, files: typing.List[disnake.File] = None):
+        if files:
+            resp = await self._http.post_with_files(base, wait, files, self.__token)
+        else:
+            resp = await self._http.post_json(base, wait, self.interaction_id, self.__token)
+        self.sent = 2
+        return resp
+
+    def _legacy_send(self, content, tts, embeds, allowed_mentions):
+        return self._post(self._make_base(content, tts, embeds, allowed_mentions))
 
     def send_hidden(self, content: str = ""):
-        base = {
-            "content": content,
-            "flags": 64
-        }
-        return self._http.post(base, False, self.interaction_id, self.__token)
+        return self._post({"content": content, "flags": 64})
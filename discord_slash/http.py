@@ -1,4 +1,3 @@
-import json
 import typing
 import aiohttp
 import disnake
@@ -95,6 +94,21 @@ class SlashCommandRequest:
         """
         if files:
             return self.post_with_files(_resp, wait, files, token)
+        return self.post_json(_resp, wait, interaction_id, token, initial)
+
+    def post_json(self, _resp, wait: bool, interaction_id, token, initial=False):
+        """
+        Sends command response POST request without files to Discord API.
+
+        :param _resp: Command response.
+        :type _resp: dict
+        :param wait: Whether the server should wait before sending a response.
+        :type wait: bool
+        :param interaction_id: Interaction ID.
+        :param token: Command message token.
+        :param initial: Whether this request is initial. Default ``False``
+        :return: Coroutine
+        """
         req_url = f"/interactions/{interaction_id}/{token}/callback" if initial else f"/webhooks/{self._discord.user.id}/{token}?wait={'true' if wait else 'false'}"
         route = CustomRoute("POST", req_url)
         return self._discord.http.request(route, json=_resp)
@@ -103,7 +117,8 @@ class SlashCommandRequest:
         req_url = f"/webhooks/{self._discord.user.id}/{token}?wait={'true' if wait else 'false'}"
         route = CustomRoute("POST", req_url)
         form = aiohttp.FormData()
-        form.add_field("payload_json", json.dumps(_resp))
+        # Same encoder disnake uses for ``json=`` requests, which is orjson if installed.
+        form.add_field("payload_json", disnake.utils._to_json(_resp))
         for x in range(len(files)):
             name = f"file{x if len(files) > 1 else ''}"
             sel = files[x]